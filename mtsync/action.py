@@ -24,20 +24,27 @@ class Action:
         self.set_dict: Dict[str, str] = set_dict or {}
         self.current_dict: Dict[str, str] = current_dict or {}
 
+        self._union_keys = (self.set_dict.keys() | self.current_dict.keys()) - {".id"}
+        self._diff_cache: Optional[List[str]] = None
+
     def diff(self) -> List[str]:
-        differences = []
+        # Both dicts are fixed at construction time, so the rendered diff
+        # can be computed once and memoized
+        if self._diff_cache is not None:
+            return self._diff_cache
 
-        keys = set(self.set_dict.keys()) | set(self.current_dict.keys()) - {".id"}
+        differences = []
 
-        for key in keys:
-            left = self.current_dict[key] if key in self.current_dict else "[empty]"
-            right = self.set_dict[key] if key in self.set_dict else "[empty]"
+        for key in self._union_keys:
+            left = self.current_dict.get(key, "[empty]")
+            right = self.set_dict.get(key, "[empty]")
 
             if left != right:
                 differences.append(
                     f" [bold blue]{key}[/bold blue]: {left} [bold]->[/bold] {right}"
                 )
 
+        self._diff_cache = differences
         return differences
 
     def __rich_repr__(self) -> Generator:
@@ -1,12 +1,12 @@
 #!/usr/bin/env python
 import asyncio
-import json
 import logging
 import sys
 from functools import wraps
 from typing import Optional, TextIO
 
 import click
+import orjson
 import uvloop
 from rich.console import Console
 
@@ -18,8 +18,9 @@ from mtsync.synchronizer import Synchronizer
 def wrap_coroutine(f):
     @wraps(f)
     def wrapper(*args, **kwargs):
-        uvloop.install()
-        asyncio.run(f(*args, **kwargs))
+        # uvloop.run avoids install()'s global policy mutation and spins the
+        # loop up through asyncio.Runner on modern Pythons
+        uvloop.run(f(*args, **kwargs))
 
     return wrapper
 
@@ -69,7 +70,8 @@ async def main(
     if desired_file == sys.stdin:
         console.log("Waiting on stdin")
 
-    desired_tree = json.load(desired_file)
+    # The read may block on stdin for a long time — keep it off the event loop
+    desired_tree = orjson.loads(await asyncio.to_thread(desired_file.read))
 
     if not isinstance(desired_tree, dict):
         console.log("[red]Expected the input data to be a dictionary/mapping.[/red]")
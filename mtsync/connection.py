@@ -1,7 +1,7 @@
-import json
 from typing import Any, Callable, Dict
 
 import aiohttp
+import orjson
 from rich.console import Console
 
 from mtsync.settings import Settings
@@ -12,21 +12,37 @@ class Connection:
         self.console = console
         self.settings = settings
 
+        # Credentials never change once the settings are resolved — encode
+        # them exactly once
+        self._auth = aiohttp.BasicAuth(
+            login=self.settings.username,
+            password=self.settings.password,
+        )
+
         self.session: aiohttp.ClientSession
 
     async def __aenter__(self):
-        self.session = await aiohttp.ClientSession().__aenter__()
+        # One keep-alive connection pool for the whole run — without it every
+        # call would pay the TCP+TLS handshake again
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=16,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+            ssl=False if self.settings.ignore_certificate_errors else True,
+        )
+        self.session = await aiohttp.ClientSession(
+            base_url=f"https://{self.settings.hostname}",
+            connector=connector,
+            auth=self._auth,
+            headers={"content-type": "application/json"},
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
+        ).__aenter__()
         return self
 
     async def __aexit__(self, *args):
         await self.session.__aexit__(*args)
 
-    def _construct_url(
-        self,
-        endpoint: str,
-    ) -> str:
-        return f"https://{self.settings.hostname}/rest{endpoint}"
-
     async def call(
         self,
         method: Callable,
@@ -34,24 +50,18 @@ class Connection:
         **kwargs: Dict[str, Any],
     ) -> None:
         async with method(
-            self._construct_url(endpoint=endpoint),
-            verify_ssl=not self.settings.ignore_certificate_errors,
-            auth=aiohttp.BasicAuth(
-                login=self.settings.username,
-                password=self.settings.password,
-            ),
-            headers={"content-type": "application/json"},
+            f"/rest{endpoint}",
             **kwargs,
         ) as response:
-            try:
-                return await response.json()
-            except aiohttp.client_exceptions.ContentTypeError:
-                text = await response.text()
+            body = await response.read()
 
-                if text == "":
-                    return None
+            if body == b"":
+                return None
 
-                return json.loads(text)
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                return None
 
     async def get(self, endpoint: str, params: Dict[str, str] = {}) -> Dict[str, str]:
         return await self.call(
@@ -1,3 +1,6 @@
 non_movable_namespaces = [
     "/ipv6/address",
 ]
+
+# Cap on concurrent REST requests — the router is a small embedded box
+concurrent_request_limit = 8
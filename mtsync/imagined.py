@@ -10,36 +10,42 @@ class Imagined:
         initial_state: List[Dict[str, str]],
     ) -> None:
         self.state = copy(initial_state)
+        # Numeric ids kept in lockstep with `state` so traversals read plain
+        # ints instead of re-parsing hex ids on every pass
+        self._ids: List[int] = [mt_int(item[".id"]) for item in self.state]
+
+        # Set by delete() when a renumbering sweep is still owed
+        self._dirty = False
 
     @property
     def _max_id(self) -> int:
         # In an ideal world this wouldn't have been a property
-        max_id = 1
-        for item in self.state:
-            item_id = mt_int(item[".id"])
-            if item_id > max_id:
-                max_id = item_id
-
-        return max_id
+        return max(self._ids, default=1)
 
     def _sort(self) -> None:
-        self.state.sort(key=lambda x: mt_int(x[".id"]))
+        order = sorted(range(len(self._ids)), key=self._ids.__getitem__)
+        self.state = [self.state[i] for i in order]
+        self._ids = [self._ids[i] for i in order]
 
     def update(
         self,
         id: str,
         new_state: Dict[str, str],
     ) -> None:
-        for i, item in enumerate(self.state):
-            if item[".id"] == mt_str(id):
-                self.state[i] = new_state | {".id": item[".id"]}
-                return
+        try:
+            i = self._ids.index(mt_int(id))
+        except ValueError:
+            return
+
+        self.state[i] = new_state | {".id": self.state[i][".id"]}
 
     def append(
         self,
         item: Dict[str, str],
     ) -> None:
-        self.state.append(dict(item.items()) | {".id": mt_str(self._max_id + 1)})
+        new_id = self._max_id + 1
+        self.state.append(dict(item.items()) | {".id": mt_str(new_id)})
+        self._ids.append(new_id)
 
     def _move_all_between(
         self,
@@ -47,28 +53,56 @@ class Imagined:
         top: Optional[Union[int, str]],
         change: int,
     ) -> None:
-        for item in self.state:
-            item_id = mt_int(item[".id"])
-            if (bottom is None or item_id >= mt_int(bottom)) and (
-                top is None or item_id < mt_int(top)
+        bottom_id = mt_int(bottom) if bottom is not None else None
+        top_id = mt_int(top) if top is not None else None
+
+        for i, item_id in enumerate(self._ids):
+            if (bottom_id is None or item_id >= bottom_id) and (
+                top_id is None or item_id < top_id
             ):
                 item_id += change
-                item[".id"] = mt_str(item_id)
+                self._ids[i] = item_id
+                # Copy on write — the initial state aliases the caller's dicts
+                self.state[i] = self.state[i] | {".id": mt_str(item_id)}
 
     def delete(self, id: Union[str, int]) -> None:
-        for i, item in enumerate(self.state):
-            if item[".id"] == mt_str(id):
-                del self.state[i]
-                self._move_all_between(bottom=i + 1, top=None, change=-1)
-                return
+        # Renumbering the remaining items is deferred to normalize() — a
+        # burst of deletes only pays for one renumbering sweep
+        try:
+            i = self._ids.index(mt_int(id))
+        except ValueError:
+            return
+
+        del self.state[i]
+        del self._ids[i]
+        self._dirty = True
+
+    def normalize(self) -> None:
+        # Deferred deletes leave holes in the numbering; renumber to the
+        # position-based ids before anything reads or moves by id. Without
+        # pending deletes the ids are the router's own — leave them alone
+        if not self._dirty:
+            return
+
+        for i in range(len(self._ids)):
+            if self._ids[i] != i + 1:
+                self._ids[i] = i + 1
+                # Copy on write — the initial state aliases the caller's dicts
+                self.state[i] = self.state[i] | {".id": mt_str(i + 1)}
+
+        self._dirty = False
 
     def move(self, number: Union[int, str], destination: Union[int, str]) -> None:
+        self.normalize()
+
         source_i = destination_i = None
+        number_id = mt_int(number)
+        destination_id = mt_int(destination)
 
-        for i, item in enumerate(self.state):
-            if item[".id"] == mt_str(number):
+        for i, item_id in enumerate(self._ids):
+            if item_id == number_id:
                 source_i = i
-            if item[".id"] == mt_str(destination):
+            if item_id == destination_id:
                 destination_i = i
 
         if source_i is None or destination_i is None:
@@ -79,5 +113,13 @@ class Imagined:
         self._move_all_between(bottom=destination, top=number, change=1)
 
         self.state.insert(destination_i, self.state[source_i])
-        del self.state[source_i + 1]  # This assumes items will be moving down
-        self.state[destination_i][".id"] = mt_str(destination)
+        self._ids.insert(destination_i, self._ids[source_i])
+        # This assumes items will be moving down
+        del self.state[source_i + 1]
+        del self._ids[source_i + 1]
+
+        # Copy on write — the initial state aliases the caller's dicts
+        self.state[destination_i] = self.state[destination_i] | {
+            ".id": mt_str(destination)
+        }
+        self._ids[destination_i] = destination_id
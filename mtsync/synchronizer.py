@@ -1,17 +1,17 @@
 import asyncio
+import heapq
 import itertools
 import json
 from copy import copy
-from typing import Any, Callable, DefaultDict, Dict, Generator, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Generator, List, Optional, Set, Tuple
 
-from frozendict import frozendict
 from rich import print as rich_print
 from rich.console import Console
 from rich.progress import Progress
 
 from mtsync.action import Action, ActionKind
 from mtsync.connection import Connection
-from mtsync.constants import non_movable_namespaces
+from mtsync.constants import concurrent_request_limit, non_movable_namespaces
 from mtsync.imagined import Imagined
 
 
@@ -24,23 +24,21 @@ class Synchronizer:
         self.console = console
         self.connection = connection
 
+        # Current state fetched ahead of the analysis, keyed by endpoint
+        self._prefetched: Dict[str, Any] = {}
+
     @staticmethod
     def _score_items(
         a: Dict[str, str],
         b: Dict[str, str],
     ) -> int:
-        # `a` is meant to have less (or equal) key count
-        if len(a.keys()) > len(b.keys()):
-            a, b = b, a
-
-        score = 0
-
-        for k, v in a.items():
-            if k == ".id":
-                continue
+        # Intersecting the dict views runs entirely in C; a matching `.id`
+        # must not count towards the score
+        common = a.items() & b.items()
+        score = len(common)
 
-            if k in b and b[k] == v:
-                score += 1
+        if ".id" in a and (".id", a[".id"]) in common:
+            score -= 1
 
         return score
 
@@ -57,12 +55,6 @@ class Synchronizer:
 
         return Synchronizer._score_items(a=a, b=b) == len(a.keys())
 
-    @staticmethod
-    def _freeze_list(
-        l: List[Dict[str, str]],
-    ) -> List[Dict[str, str]]:
-        return [frozendict(d) for d in l]
-
     async def _analyze_list_add_remove(
         self,
         current_path: str,
@@ -70,58 +62,88 @@ class Synchronizer:
         desired_items: List[Dict[str, str]],
         imagined_items: Imagined,
     ) -> List[Action]:
-        scores: Dict[Any, Dict[Any, Any]] = DefaultDict(dict)
         actions: List[Action] = []
 
-        current_items = self._freeze_list(current_items)
-        desired_items = self._freeze_list(desired_items)
-
-        for current_item in current_items:
-            for desired_item in desired_items:
-                scores[current_item][desired_item] = self._score_items(
-                    a=current_item, b=desired_item
-                )
-
-        while len(current_items) > 0 and len(desired_items) > 0:
-            max_score = 0
-            max_current_item = None
-            max_desired_item = None
-
-            for current_item, desired_item in itertools.product(
-                current_items, desired_items
-            ):
-                if scores[current_item][desired_item] > max_score:
-                    max_score = scores[current_item][desired_item]
-                    max_current_item = current_item
-                    max_desired_item = desired_item
-
-            if max_current_item is None or max_desired_item is None:
-                raise Exception()
+        # Encode every item once as a set of its key/value pairs (minus `.id`)
+        # so the N×M scoring pass below is a single C-level intersection per
+        # pair instead of re-filtering `.id` N×M times
+        current_sets = [
+            frozenset(kv for kv in item.items() if kv[0] != ".id")
+            for item in current_items
+        ]
+        desired_sets = [
+            frozenset(kv for kv in item.items() if kv[0] != ".id")
+            for item in desired_items
+        ]
+
+        used_current: Set[int] = set()
+        used_desired: Set[int] = set()
+
+        # Identical pairs need no action at all — pair them up front so the
+        # quadratic scoring below only sees items that actually differ
+        exact_buckets: Dict[FrozenSet[Tuple[str, str]], List[int]] = {}
+
+        for current_i, signature in enumerate(current_sets):
+            exact_buckets.setdefault(signature, []).append(current_i)
+
+        for desired_i, signature in enumerate(desired_sets):
+            bucket = exact_buckets.get(signature)
+            if bucket:
+                used_current.add(bucket.pop())
+                used_desired.add(desired_i)
+
+        # Score every remaining pair once and let a heap hand out the best
+        # remaining pair; heapq is a min-heap thus the scores are negated.
+        # Pairs with nothing in common never enter the heap — they are better
+        # served by a PUT/DELETE than a PATCH anyway
+        heap = [
+            (-score, current_i, desired_i)
+            for current_i in range(len(current_items))
+            if current_i not in used_current
+            for desired_i in range(len(desired_items))
+            if desired_i not in used_desired
+            and (score := len(current_sets[current_i] & desired_sets[desired_i])) > 0
+        ]
+        heapq.heapify(heap)
+
+        while heap:
+            _, current_i, desired_i = heapq.heappop(heap)
+
+            if current_i in used_current or desired_i in used_desired:
+                continue
 
-            # max_score is not really important now
-            # max_current_item and max_desired item hold values to work on
+            used_current.add(current_i)
+            used_desired.add(desired_i)
 
-            current_items.remove(max_current_item)
-            desired_items.remove(max_desired_item)
+            current_item = current_items[current_i]
+            desired_item = desired_items[desired_i]
 
-            for k, v in max_desired_item.items():
-                if (k not in max_current_item and v != "") or (
-                    k in max_current_item and max_current_item[k] != v
+            for k, v in desired_item.items():
+                if (k not in current_item and v != "") or (
+                    k in current_item and current_item[k] != v
                 ):
                     actions.append(
                         Action(
                             kind=ActionKind.PATCH,
-                            path=f"{current_path}/{max_current_item['.id']}",
-                            set_dict=max_desired_item,
-                            current_dict=max_current_item,
+                            path=f"{current_path}/{current_item['.id']}",
+                            set_dict=desired_item,
+                            current_dict=current_item,
                         )
                     )
                     imagined_items.update(
-                        id=max_current_item[".id"], new_state=max_desired_item
+                        id=current_item[".id"], new_state=desired_item
                     )
                     break
 
-        for desired_item in desired_items:
+            if len(used_current) == len(current_items) or len(used_desired) == len(
+                desired_items
+            ):
+                break
+
+        for desired_i, desired_item in enumerate(desired_items):
+            if desired_i in used_desired:
+                continue
+
             actions.append(
                 Action(
                     kind=ActionKind.PUT,
@@ -131,7 +153,10 @@ class Synchronizer:
             )
             imagined_items.append(desired_item)
 
-        for current_item in current_items:
+        for current_i, current_item in enumerate(current_items):
+            if current_i in used_current:
+                continue
+
             actions.append(
                 Action(
                     kind=ActionKind.DELETE,
@@ -152,6 +177,10 @@ class Synchronizer:
         if current_path in non_movable_namespaces:
             return []
 
+        # Deletes from the add/remove pass defer renumbering; reordering
+        # reads ids, so bring them back to contiguous first
+        imagined_items.normalize()
+
         actions: List[Action] = []
 
         for desired_i, desired_item in enumerate(desired_items):
@@ -180,23 +209,76 @@ class Synchronizer:
 
         return actions
 
+    @staticmethod
+    def _list_query_params(
+        analyzed_list: List[Dict[str, str]],
+    ) -> Dict[str, str]:
+        proplist = set(
+            itertools.chain.from_iterable(item.keys() for item in analyzed_list)
+        ) | {".id"}
+
+        return {
+            "dynamic": "false",
+            ".proplist": ",".join(proplist),
+        }
+
+    def _collect_requests(
+        self,
+        current_path: str,
+        tree: Dict[str, Any],
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        requests: List[Tuple[str, Dict[str, str]]] = []
+
+        if tree is None or isinstance(tree, list):
+            return requests
+
+        for k, v in tree.items():
+            item_path = f"{current_path}/{k}"
+
+            if isinstance(v, list):
+                requests.append((item_path, self._list_query_params(analyzed_list=v)))
+            elif (
+                isinstance(v, dict)
+                and len(v.values()) > 0
+                and isinstance(next(iter(v.values())), str)
+            ):
+                requests.append((item_path, {}))
+            else:  # Not a leaf, collect from the subtree
+                requests += self._collect_requests(current_path=item_path, tree=v)
+
+        return requests
+
+    async def _prefetch(
+        self,
+        tree: Dict[str, Any],
+    ) -> None:
+        requests = self._collect_requests(current_path="", tree=tree)
+        semaphore = asyncio.Semaphore(concurrent_request_limit)
+
+        async def fetch(endpoint: str, params: Dict[str, str]) -> None:
+            async with semaphore:
+                self._prefetched[endpoint] = await self.connection.get(
+                    endpoint=endpoint,
+                    params=params,
+                )
+
+        await asyncio.gather(
+            *[fetch(endpoint, params) for endpoint, params in requests]
+        )
+
     async def _analyze_list(
         self,
         current_path: str,
         analyzed_list: List[Dict[str, str]],
     ) -> List[Action]:
         desired_items = analyzed_list
-        proplist = set(itertools.chain(*[item.keys() for item in desired_items])) | {
-            ".id"
-        }
 
-        current_items = await self.connection.get(
-            endpoint=current_path,
-            params={
-                "dynamic": "false",
-                ".proplist": ",".join(proplist),
-            },
-        )
+        current_items = self._prefetched.pop(current_path, None)
+        if current_items is None:
+            current_items = await self.connection.get(
+                endpoint=current_path,
+                params=self._list_query_params(analyzed_list=analyzed_list),
+            )
 
         actions: List[Action] = []
         imagined_items = Imagined(initial_state=current_items)
@@ -221,54 +303,130 @@ class Synchronizer:
         current_path: str,
         analyzed_dict: Dict[str, str],
     ) -> List[Action]:
-        current_state = await self.connection.get(endpoint=current_path)
+        current_state = self._prefetched.pop(current_path, None)
+        if current_state is None:
+            current_state = await self.connection.get(endpoint=current_path)
+
         desired_state = analyzed_dict
 
-        for k, v in desired_state.items():
-            if current_state[k] != v:
-                return [
-                    Action(
-                        kind=ActionKind.POST,
-                        path=f"{current_path}/set",
-                        set_dict=analyzed_dict,
-                        current_dict=current_state,
-                    )
-                ]
+        # The POST carries the whole desired dict anyway, so "anything
+        # differs" is just a C-level subset test on the dict views — which
+        # also copes with keys missing from the current state
+        if desired_state.items() <= current_state.items():
+            return []
 
-        return []
+        return [
+            Action(
+                kind=ActionKind.POST,
+                path=f"{current_path}/set",
+                set_dict=analyzed_dict,
+                current_dict=current_state,
+            )
+        ]
 
     async def _analyze(
         self,
         current_path: str,
         tree: Dict[str, Any],
     ) -> List[Action]:
-        awaitables = []
-
         if tree is None:
             return []
 
         if isinstance(tree, list):
             raise Exception("Expected input data to be a dictionary/mapping")
 
-        for k, v in tree.items():
-            item_path = f"{current_path}/{k}"
+        # Walk the whole tree synchronously, scheduling a task the moment a
+        # leaf is found — one flat gather at the end instead of an await
+        # barrier per recursion level
+        tasks: List[Any] = []
+        stack: List[Tuple[str, Dict[str, Any]]] = [(current_path, tree)]
 
-            if isinstance(v, list):
-                awaitables.append(
-                    self._analyze_list(current_path=item_path, analyzed_list=v)
-                )
-            elif (
-                isinstance(v, dict)
-                and len(v.values()) > 0
-                and isinstance(next(iter(v.values())), str)
+        while stack:
+            path, node = stack.pop()
+
+            if node is None:
+                continue
+
+            for k, v in node.items():
+                item_path = f"{path}/{k}"
+
+                if isinstance(v, list):
+                    tasks.append(
+                        asyncio.create_task(
+                            self._analyze_list(current_path=item_path, analyzed_list=v)
+                        )
+                    )
+                elif (
+                    isinstance(v, dict)
+                    and len(v.values()) > 0
+                    and isinstance(next(iter(v.values())), str)
+                ):
+                    tasks.append(
+                        asyncio.create_task(
+                            self._analyze_dict(current_path=item_path, analyzed_dict=v)
+                        )
+                    )
+                else:  # No idea what is this, traverse again
+                    stack.append((item_path, v))
+
+        return list(itertools.chain.from_iterable(await asyncio.gather(*tasks)))
+
+    @staticmethod
+    def _group_key(action: Action) -> str:
+        # PUT paths already point at the namespace itself; the other kinds
+        # carry an id (or a command) as the last path segment
+        if action.kind == ActionKind.PUT:
+            return action.path
+
+        return action.path.rsplit("/", 1)[0]
+
+    async def _apply_action(
+        self,
+        action: Action,
+        dispatch: Dict[ActionKind, Tuple[Callable, bool]],
+        progress: Progress,
+        progress_tasks: Dict[ActionKind, Any],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        if action.kind not in dispatch:
+            raise Exception(f"Unknown action kind: {action.kind}")
+
+        method, has_body = dispatch[action.kind]
+        kwargs = {"json": action.set_dict} if has_body else {}
+
+        async with semaphore:
+            result = await method(endpoint=action.path, **kwargs)
+
+        progress.update(progress_tasks[action.kind], advance=1)
+
+        if result is not None and "error" in result:
+            if (
+                "detail" in result
+                and result["detail"] == "no such command"
+                and action.path.endswith("/move")
             ):
-                awaitables.append(
-                    self._analyze_dict(current_path=item_path, analyzed_dict=v)
-                )
-            else:  # No idea what is this, traverse again
-                awaitables.append(self._analyze(current_path=item_path, tree=v))
+                return
+
+            self.console.log("Error while executing", action)
+            self.console.log("Result", result)
+            raise Exception()
 
-        return list(itertools.chain(*await asyncio.gather(*awaitables)))
+    async def _apply_group(
+        self,
+        group: List[Action],
+        dispatch: Dict[ActionKind, Tuple[Callable, bool]],
+        progress: Progress,
+        progress_tasks: Dict[ActionKind, Any],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        for action in group:
+            await self._apply_action(
+                action=action,
+                dispatch=dispatch,
+                progress=progress,
+                progress_tasks=progress_tasks,
+                semaphore=semaphore,
+            )
 
     async def _apply(
         self,
@@ -278,19 +436,26 @@ class Synchronizer:
             console=self.console,
             expand=True,
         ) as progress:
+            # One pass over the actions yields both the phase grouping and
+            # the progress totals
+            phases: Dict[ActionKind, Dict[str, List[Action]]] = {
+                kind: {} for kind in ActionKind
+            }
+
+            for action in actions:
+                phases[action.kind].setdefault(self._group_key(action), []).append(
+                    action
+                )
+
+            counts = {
+                kind: sum(map(len, groups.values())) for kind, groups in phases.items()
+            }
+
             padding_left = " " * 10
-            patch_actions_available = len(
-                [a for a in actions if a.kind == ActionKind.PATCH]
-            )
-            put_actions_available = len(
-                [a for a in actions if a.kind == ActionKind.PUT]
-            )
-            delete_actions_available = len(
-                [a for a in actions if a.kind == ActionKind.DELETE]
-            )
-            post_actions_available = len(
-                [a for a in actions if a.kind == ActionKind.POST]
-            )
+            patch_actions_available = counts[ActionKind.PATCH]
+            put_actions_available = counts[ActionKind.PUT]
+            delete_actions_available = counts[ActionKind.DELETE]
+            post_actions_available = counts[ActionKind.POST]
 
             patch_progress = progress.add_task(
                 f"{padding_left}[cyan] Patching objects...",
@@ -313,49 +478,56 @@ class Synchronizer:
                 visible=post_actions_available > 0,
             )
 
-            # These actions must be executed one after another thus no asyncio.gather possible
-            for action in actions:
-                if action.kind == ActionKind.PATCH:
-                    result = await self.connection.patch(
-                        endpoint=action.path,
-                        json=action.set_dict,
-                    )
-                    progress.update(patch_progress, advance=1)
-
-                elif action.kind == ActionKind.PUT:
-                    result = await self.connection.put(
-                        endpoint=action.path,
-                        json=action.set_dict,
-                    )
-                    progress.update(put_progress, advance=1)
-
-                elif action.kind == ActionKind.DELETE:
-                    result = await self.connection.delete(
-                        endpoint=action.path,
-                    )
-                    progress.update(delete_progress, advance=1)
-
-                elif action.kind == ActionKind.POST:
-                    result = await self.connection.post(
-                        endpoint=action.path,
-                        json=action.set_dict,
+            progress_tasks = {
+                ActionKind.PATCH: patch_progress,
+                ActionKind.PUT: put_progress,
+                ActionKind.DELETE: delete_progress,
+                ActionKind.POST: post_progress,
+            }
+            semaphore = asyncio.Semaphore(concurrent_request_limit)
+
+            # Kind → (connection method, whether the call carries a body)
+            dispatch: Dict[ActionKind, Tuple[Callable, bool]] = {
+                ActionKind.PATCH: (self.connection.patch, True),
+                ActionKind.PUT: (self.connection.put, True),
+                ActionKind.DELETE: (self.connection.delete, False),
+                ActionKind.POST: (self.connection.post, True),
+            }
+
+            # Actions of different kinds must be executed phase by phase
+            # (PATCH < PUT < DELETE < POST), and actions within one namespace
+            # may depend on each other (ids shift after DELETE/PUT) — but
+            # groups of actions touching unrelated namespaces are independent
+            # and can be in flight concurrently
+            for kind in ActionKind:
+                groups = phases[kind]
+
+                if len(groups) == 0:
+                    continue
+
+                tasks = [
+                    asyncio.create_task(
+                        self._apply_group(
+                            group=group,
+                            dispatch=dispatch,
+                            progress=progress,
+                            progress_tasks=progress_tasks,
+                            semaphore=semaphore,
+                        )
                     )
-                    progress.update(post_progress, advance=1)
-
-                else:
-                    raise Exception(f"Unknown action kind: {action.kind}")
+                    for group in groups.values()
+                ]
 
-                if result is not None and "error" in result:
-                    if (
-                        "detail" in result
-                        and result["detail"] == "no such command"
-                        and action.path.endswith("/move")
-                    ):
-                        continue
+                try:
+                    await asyncio.gather(*tasks)
+                except BaseException:
+                    # One group failed — stop mutating the router and reap
+                    # the sibling tasks before propagating
+                    for task in tasks:
+                        task.cancel()
 
-                    self.console.log("Error while executing", action)
-                    self.console.log("Result", result)
-                    raise Exception()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
 
     def _human_readable_diff(
         self,
@@ -389,6 +561,7 @@ class Synchronizer:
         desired_tree: Dict,
     ) -> None:
         self.console.log("Analyzing desired and current configurations...")
+        await self._prefetch(tree=desired_tree)
         actions = await self._analyze(
             current_path="",
             tree=desired_tree,
@@ -401,9 +574,10 @@ class Synchronizer:
         # This sort is 1) a "safe" heuristic 2) needed for element ids to be stable
         actions.sort(key=lambda action: action.kind.value)
 
-        self.console.log(
-            "List of differences:", self._human_readable_diff(actions=actions)
-        )
+        self.console.log("List of differences:")
+        # All the formatting is explicit markup — highlight=False keeps
+        # Rich's regex-based auto-highlighter away from every line
+        self.console.print(self._human_readable_diff(actions=actions), highlight=False)
 
         self.console.log("Applying actions to synchronize the configuration...")
         await self._apply(actions=actions)
@@ -0,0 +1,44 @@
+from mtsync.action import Action, ActionKind
+from testslide.dsl import context
+
+
+@context
+def ActionTest(context):
+    @context.sub_context
+    def diff(context):
+        @context.example
+        async def excludes_id_on_both_sides(self):
+            action = Action(
+                kind=ActionKind.PATCH,
+                path="/ip/example/1",
+                set_dict={".id": "2", "key": "value"},
+                current_dict={".id": "1", "key": "value"},
+            )
+            self.assertEqual(action.diff(), [])
+
+        @context.example
+        async def renders_missing_keys_as_empty(self):
+            action = Action(
+                kind=ActionKind.PATCH,
+                path="/ip/example/1",
+                set_dict={"added": "new"},
+                current_dict={"removed": "old"},
+            )
+            differences = action.diff()
+            self.assertEqual(len(differences), 2)
+
+            for line in differences:
+                self.assertIn("[empty]", line)
+
+        @context.example
+        async def simple(self):
+            action = Action(
+                kind=ActionKind.PATCH,
+                path="/ip/example/1",
+                set_dict={"key": "new"},
+                current_dict={"key": "old", ".id": "1"},
+            )
+            differences = action.diff()
+            self.assertEqual(len(differences), 1)
+            self.assertIn("old", differences[0])
+            self.assertIn("new", differences[0])
@@ -48,6 +48,34 @@ def ImaginedTest(context):
         ]
         im = Imagined(initial_state=initial_state)
         im.delete(id="2")
+        self.assertEqual(
+            im.state,
+            [
+                {"key": "value1", ".id": "1"},
+                {"key": "value3", ".id": "3"},
+            ],
+        )
+
+    @context.example
+    async def normalize_without_deletes(self):
+        initial_state = [
+            {"key": "value1", ".id": "4"},
+            {"key": "value2", ".id": "6"},
+        ]
+        im = Imagined(initial_state=initial_state)
+        im.normalize()
+        self.assertEqual(im.state, initial_state)
+
+    @context.example
+    async def normalize(self):
+        initial_state = [
+            {"key": "value1", ".id": "1"},
+            {"key": "value2", ".id": "2"},
+            {"key": "value3", ".id": "3"},
+        ]
+        im = Imagined(initial_state=initial_state)
+        im.delete(id="2")
+        im.normalize()
         self.assertEqual(
             im.state,
             [
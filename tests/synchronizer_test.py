@@ -217,7 +217,99 @@ def SynchronizerTest(context):
 
             @context.sub_context
             def add_remove(context):
-                pass  # @TODO
+                @context.example
+                async def exact_pairs(self):
+                    current_items = [
+                        {"field": "value1", ".id": "1"},
+                        {"field": "value2", ".id": "2"},
+                    ]
+                    actions = await self.synchronizer._analyze_list_add_remove(
+                        current_path="/ip/example",
+                        current_items=current_items,
+                        desired_items=[
+                            {"field": "value2"},
+                            {"field": "value1"},
+                        ],
+                        imagined_items=Imagined(initial_state=current_items),
+                    )
+
+                    self.assertEqual(actions, [], f"Got actions: {actions}")
+
+                @context.example
+                async def patch(self):
+                    current_items = [
+                        {"field": "old", "other": "same", ".id": "1"},
+                    ]
+                    actions = await self.synchronizer._analyze_list_add_remove(
+                        current_path="/ip/example",
+                        current_items=current_items,
+                        desired_items=[
+                            {"field": "new", "other": "same"},
+                        ],
+                        imagined_items=Imagined(initial_state=current_items),
+                    )
+
+                    self.assertEqual(len(actions), 1, f"Got actions: {actions}")
+                    self.assertEqual(actions[0].kind, ActionKind.PATCH)
+                    self.assertEqual(actions[0].path, "/ip/example/1")
+                    self.assertEqual(
+                        actions[0].set_dict,
+                        {"field": "new", "other": "same"},
+                    )
+
+                @context.example
+                async def put_leftover(self):
+                    actions = await self.synchronizer._analyze_list_add_remove(
+                        current_path="/ip/example",
+                        current_items=[],
+                        desired_items=[
+                            {"field": "value1"},
+                        ],
+                        imagined_items=Imagined(initial_state=[]),
+                    )
+
+                    self.assertEqual(len(actions), 1, f"Got actions: {actions}")
+                    self.assertEqual(actions[0].kind, ActionKind.PUT)
+                    self.assertEqual(actions[0].path, "/ip/example")
+                    self.assertEqual(actions[0].set_dict, {"field": "value1"})
+
+                @context.example
+                async def delete_leftover(self):
+                    current_items = [
+                        {"field": "value1", ".id": "1"},
+                    ]
+                    actions = await self.synchronizer._analyze_list_add_remove(
+                        current_path="/ip/example",
+                        current_items=current_items,
+                        desired_items=[],
+                        imagined_items=Imagined(initial_state=current_items),
+                    )
+
+                    self.assertEqual(len(actions), 1, f"Got actions: {actions}")
+                    self.assertEqual(actions[0].kind, ActionKind.DELETE)
+                    self.assertEqual(actions[0].path, "/ip/example/1")
+
+                @context.example
+                async def zero_score_fallthrough(self):
+                    # Items with nothing in common must not be paired into a
+                    # PATCH — they fall through to a PUT plus a DELETE
+                    current_items = [
+                        {"field": "value1", ".id": "1"},
+                    ]
+                    actions = await self.synchronizer._analyze_list_add_remove(
+                        current_path="/ip/example",
+                        current_items=current_items,
+                        desired_items=[
+                            {"other": "value2"},
+                        ],
+                        imagined_items=Imagined(initial_state=current_items),
+                    )
+
+                    self.assertEqual(len(actions), 2, f"Got actions: {actions}")
+                    self.assertEqual(actions[0].kind, ActionKind.PUT)
+                    self.assertEqual(actions[0].set_dict, {"other": "value2"})
+                    self.assertEqual(actions[1].kind, ActionKind.DELETE)
+                    self.assertEqual(actions[1].path, "/ip/example/1")
 
             @context.sub_context
             def reorder(context):
@@ -253,6 +345,36 @@ def SynchronizerTest(context):
                         },
                     )
 
+                @context.example
+                async def non_contiguous_ids(self):
+                    actions = await self.synchronizer._analyze_list_reorder(
+                        current_path="/ip/example",
+                        imagined_items=Imagined(
+                            initial_state=[
+                                {"field": "value2", ".id": "4"},
+                                {"field": "value3", ".id": "5"},
+                                {"field": "value1", ".id": "6"},
+                            ]
+                        ),
+                        desired_items=[
+                            {"field": "value1"},
+                            {"field": "value2"},
+                            {"field": "value3"},
+                        ],
+                    )
+
+                    self.assertEqual(len(actions), 1, f"Got actions: {actions}")
+
+                    # The router only knows its own ids — nothing may be
+                    # renumbered just because the list is not 1-based
+                    self.assertEqual(
+                        actions[0].set_dict,
+                        {
+                            "numbers": "6",
+                            "destination": "4",
+                        },
+                    )
+
                 @context.example
                 async def same(self):
                     actions = await self.synchronizer._analyze_list_reorder(